@@ -3,18 +3,21 @@ Interface Web Interactive pour TrueSkill Matchmaking Simulator
 Lancer avec : streamlit run app. py
 """
 import streamlit as st
+import matplotlib
+matplotlib.use('Agg')  # Rendu sans fenêtre : les figures sont affichées via st.pyplot
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import random
 import time
 from src.player import Player
-from src. simulator import MatchSimulator
+from src. simulator import MatchSimulator, random_pairs
 from src.utils import create_tiered_players, create_random_players
 from src.visualizer import (
     plot_skill_convergence,
     plot_uncertainty_decrease,
     plot_matchmaking_heatmap,
-    plot_before_after
+    plot_before_after,
+    matchmaking_matrices
 )
 
 # Configuration de la page
@@ -25,6 +28,70 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+
+# Calculs mis en cache : Streamlit réexécute tout le script à chaque
+# interaction, on ne recalcule donc que si l'état des joueurs a changé
+def player_state(player):
+    """Clé de cache d'un joueur (rating, statistiques et taille de l'historique)"""
+    return (player.name, player.true_skill, player.rating.mu, player.rating.sigma,
+            player.matches_played, player.wins, player.losses,
+            len(player.history_sigma))
+
+
+# Seule la dernière simulation est affichée : quelques entrées suffisent
+CACHE_MAX_ENTRIES = 4
+
+
+@st.cache_data(hash_funcs={Player: player_state}, max_entries=CACHE_MAX_ENTRIES)
+def build_ranking_dataframe(players):
+    """Construit le tableau du classement final (cached)"""
+    leaderboard = sorted(players, key=lambda p:  p.conservative_rating, reverse=True)
+    
+    ranking_data = []
+    for rank, player in enumerate(leaderboard, 1):
+        # Emoji selon le rang
+        if rank == 1:
+            emoji = "🥇"
+        elif rank == 2:
+            emoji = "🥈"
+        elif rank == 3:
+            emoji = "🥉"
+        else:
+            emoji = f"{rank}."
+        
+        ranking_data.append({
+            "Rang":  emoji,
+            "Joueur": player.name,
+            "TrueSkill (μ)": f"{player.rating.mu:.1f}",
+            "Incertitude (σ)": f"{player.rating.sigma:.2f}",
+            "Rating Conserv.": f"{player.conservative_rating:.1f}",
+            "Vraie Compét.": f"{player.true_skill:.1f}",
+            "W/L": f"{player.wins}/{player.losses}",
+            "Taux Victoire": f"{player.win_rate:.0f}%"
+        })
+    
+    return pd.DataFrame(ranking_data)
+
+
+@st.cache_data(hash_funcs={Player: player_state}, max_entries=CACHE_MAX_ENTRIES)
+def compute_matchmaking_matrices(players):
+    """Calcule les matrices de probabilités de victoire et de qualité (cached)"""
+    return matchmaking_matrices(players)
+
+
+@st.cache_data(hash_funcs={Player: player_state}, max_entries=CACHE_MAX_ENTRIES)
+def compute_average_sigma_history(players):
+    """Calcule la moyenne de sigma à chaque étape (cached)"""
+    # Historiques de longueurs différentes : une matrice préallouée
+    # complétée par des NaN, puis une moyenne par colonne qui les ignore
+    max_len = max(len(p.history_sigma) for p in players)
+    sigmas = np.full((len(players), max_len), np.nan, dtype=np.float32)
+    
+    for k, p in enumerate(players):
+        sigmas[k, :len(p.history_sigma)] = p.history_sigma
+    
+    return np.nanmean(sigmas, axis=0)
+
 # Style CSS personnalisé
 st.markdown("""
     <style>
@@ -127,14 +194,13 @@ st.sidebar.markdown("---")
 
 # Bouton principal de simulation
 if st.sidebar.button("🚀 LANCER LA SIMULATION", type="primary"):
-    # Initialiser le seed si nécessaire
-    if seed_value is not None:
-        random.seed(seed_value)
+    # Initialiser le générateur (avec le seed si nécessaire)
+    rng = np.random.default_rng(seed_value)
     
     # Créer les joueurs
     with st.spinner("🎲 Création des joueurs... "):
         if mode == "🎲 Joueurs aléatoires":
-            players = create_random_players(num_players, min_skill, max_skill)
+            players = create_random_players(num_players, min_skill, max_skill, rng=rng)
         else:
             players = create_tiered_players()
         
@@ -155,7 +221,7 @@ if st.sidebar.button("🚀 LANCER LA SIMULATION", type="primary"):
         st.dataframe(pd.DataFrame(player_data), use_container_width=True, hide_index=True)
     
     # Simuler les matchs
-    simulator = MatchSimulator(players)
+    simulator = MatchSimulator(players, rng=rng, record_history=False)
     
     st.markdown("---")
     st.subheader("⚔️ Simulation en cours...")
@@ -169,10 +235,9 @@ if st.sidebar.button("🚀 LANCER LA SIMULATION", type="primary"):
     for i in range(0, num_matches, batch_size):
         batch_end = min(i + batch_size, num_matches)
         
-        # Simuler le batch
-        for j in range(batch_end - i):
-            p1, p2 = random.sample(players, 2)
-            simulator.simulate_1v1(p1, p2)
+        # Simuler le batch (performances tirées en un seul appel)
+        idx1, idx2 = random_pairs(len(players), batch_end - i, simulator.rng)
+        simulator.simulate_pairs(idx1, idx2)
         
         # Mettre à jour la progression
         progress = batch_end / num_matches
@@ -282,33 +347,8 @@ if 'simulation_done' in st.session_state and st.session_state['simulation_done']
         st.subheader("🏆 Classement Final")
         
         # Tableau de classement
-        leaderboard = sorted(players, key=lambda p:  p.conservative_rating, reverse=True)
-        
-        ranking_data = []
-        for rank, player in enumerate(leaderboard, 1):
-            # Emoji selon le rang
-            if rank == 1:
-                emoji = "🥇"
-            elif rank == 2:
-                emoji = "🥈"
-            elif rank == 3:
-                emoji = "🥉"
-            else:
-                emoji = f"{rank}."
-            
-            ranking_data. append({
-                "Rang":  emoji,
-                "Joueur": player.name,
-                "TrueSkill (μ)": f"{player.rating.mu:.1f}",
-                "Incertitude (σ)": f"{player.rating.sigma:.2f}",
-                "Rating Conserv.": f"{player.conservative_rating:.1f}",
-                "Vraie Compét.": f"{player.true_skill:.1f}",
-                "W/L": f"{player.wins}/{player.losses}",
-                "Taux Victoire": f"{player.win_rate:.0f}%"
-            })
-        
         st.dataframe(
-            pd.DataFrame(ranking_data),
+            build_ranking_dataframe(players),
             use_container_width=True,
             hide_index=True
         )
@@ -350,26 +390,10 @@ if 'simulation_done' in st.session_state and st.session_state['simulation_done']
             st.info("💡 Cette heatmap montre les probabilités de victoire et la qualité des matchs potentiels")
             
             # Générer et afficher la heatmap
-            import numpy as np
-            from scipy.stats import norm
-            from trueskill import quality_1vs1
             import seaborn as sns
             
             n = len(players)
-            win_probs = np.zeros((n, n))
-            match_quality = np.zeros((n, n))
-            
-            for i in range(n):
-                for j in range(n):
-                    if i == j:
-                        win_probs[i][j] = np.nan
-                        match_quality[i][j] = np.nan
-                    else:
-                        delta_mu = players[i].rating.mu - players[j].rating.mu
-                        sum_sigma = players[i].rating.sigma**2 + players[j].rating.sigma**2
-                        beta = 25/6
-                        win_probs[i][j] = norm.cdf(delta_mu / np.sqrt(2 * beta**2 + sum_sigma))
-                        match_quality[i][j] = quality_1vs1(players[i].rating, players[j].rating)
+            win_probs, match_quality = compute_matchmaking_matrices(players)
             
             col1, col2 = st. columns(2)
             
@@ -432,12 +456,7 @@ if 'simulation_done' in st.session_state and st.session_state['simulation_done']
                 fig7, ax7 = plt.subplots(figsize=(8, 6))
                 
                 # Calculer la moyenne de sigma à chaque étape
-                max_len = max(len(p.history_sigma) for p in players)
-                avg_sigma_history = []
-                
-                for i in range(max_len):
-                    sigmas_at_i = [p.history_sigma[i] for p in players if i < len(p.history_sigma)]
-                    avg_sigma_history.append(sum(sigmas_at_i) / len(sigmas_at_i))
+                avg_sigma_history = compute_average_sigma_history(players)
                 
                 ax7.plot(avg_sigma_history, linewidth=3, color='purple')
                 ax7.axhline(y=8.333, linestyle='--', color='red', alpha=0.5, label='σ initial')
@@ -1,10 +1,9 @@
 """
 Comparaison entre TrueSkill et ELO
 """
-import random
 import numpy as np
 from src. player import Player
-from src.simulator import MatchSimulator
+from src.simulator import MatchSimulator, random_pairs, simulate_batch
 from src.elo import EloPlayer, EloSimulator
 from trueskill import rate_1vs1
 
@@ -22,9 +21,7 @@ def create_parallel_players(num_players, min_skill=15, max_skill=35, seed=None):
     Returns:
         tuple: (trueskill_players, elo_players)
     """
-    if seed is not None:
-        random.seed(seed)
-        np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     
     names = [
         "Alice", "Bob", "Charlie", "David", "Eve", "Frank",
@@ -33,7 +30,7 @@ def create_parallel_players(num_players, min_skill=15, max_skill=35, seed=None):
     ]
     
     # Générer les compétences
-    true_skills = [random.uniform(min_skill, max_skill) for _ in range(num_players)]
+    true_skills = rng.uniform(min_skill, max_skill, num_players).tolist()
     
     # Créer les joueurs TrueSkill
     trueskill_players = []
@@ -64,8 +61,7 @@ def run_parallel_simulation(trueskill_players, elo_players, num_matches, seed=No
     Returns:
         tuple: (ts_simulator, elo_simulator)
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
     
     ts_simulator = MatchSimulator(trueskill_players)
     elo_simulator = EloSimulator(elo_players)
@@ -74,17 +70,21 @@ def run_parallel_simulation(trueskill_players, elo_players, num_matches, seed=No
         print(f"\n🎮 Simulation de {num_matches} matchs identiques pour TrueSkill et ELO...")
         print("="*80)
     
+    # Choisir les mêmes paires pour les deux systèmes
+    idx1s, idx2s = random_pairs(len(trueskill_players), num_matches, rng)
+    
+    # Simuler la performance (basée sur la vraie compétence)
+    beta = 25 / 6
+    perfs1, perfs2 = simulate_batch([trueskill_players[i].true_skill for i in idx1s],
+                                    [trueskill_players[i].true_skill for i in idx2s],
+                                    beta=beta, rng=rng)
+    
     for i in range(num_matches):
-        # Choisir les mêmes paires pour les deux systèmes
-        idx1, idx2 = random.sample(range(len(trueskill_players)), 2)
+        idx1, idx2 = idx1s[i], idx2s[i]
         
         ts_p1, ts_p2 = trueskill_players[idx1], trueskill_players[idx2]
         elo_p1, elo_p2 = elo_players[idx1], elo_players[idx2]
-        
-        # Simuler la performance (basée sur la vraie compétence)
-        beta = 25 / 6
-        perf1 = random.gauss(ts_p1.true_skill, beta)
-        perf2 = random.gauss(ts_p2.true_skill, beta)
+        perf1, perf2 = perfs1[i], perfs2[i]
         
         # Déterminer le gagnant (même pour les deux systèmes)
         ts_winner = ts_p1 if perf1 > perf2 else ts_p2
@@ -1,6 +1,8 @@
 """
 Script de démonstration de la comparaison TrueSkill vs ELO
 """
+import matplotlib
+matplotlib.use('Agg')  # Rendu sans fenêtre : les graphiques sont sauvegardés en PNG
 from comparison import (
     create_parallel_players,
     run_parallel_simulation,
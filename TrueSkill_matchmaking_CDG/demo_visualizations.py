@@ -2,6 +2,8 @@
 Script de démonstration des visualisations
 """
 import random
+import matplotlib
+matplotlib.use('Agg')  # Rendu sans fenêtre : les graphiques sont sauvegardés en PNG
 from src.utils import create_tiered_players, create_random_players
 from src.simulator import MatchSimulator
 from src.visualizer import create_all_visualizations
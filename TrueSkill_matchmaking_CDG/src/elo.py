@@ -19,6 +19,10 @@ class EloPlayer:
         k_factor (float): Facteur K (sensibilité aux changements)
     """
     
+    # Attributs fixes : pas de __dict__ par instance, accès plus rapide
+    __slots__ = ('name', 'true_skill', 'rating', 'history', 'matches_played',
+                 'wins', 'losses', 'k_factor')
+    
     def __init__(self, name, true_skill, initial_rating=1500, k_factor=32):
         """
         Initialise un joueur ELO
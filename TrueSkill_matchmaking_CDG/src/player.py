@@ -1,9 +1,12 @@
 """
 Classe Player : Représente un joueur avec sa vraie compétence et son rating TrueSkill
 """
-import random
+import numpy as np
 from trueskill import Rating
 
+# Générateur par défaut (PCG64) pour les tirages de performance
+_default_rng = np.random.default_rng()
+
 
 class Player:
     """
@@ -20,6 +23,10 @@ class Player:
         losses (int): Nombre de défaites
     """
     
+    # Attributs fixes : pas de __dict__ par instance, accès plus rapide
+    __slots__ = ('name', 'true_skill', 'rating', 'history_mu', 'history_sigma',
+                 'matches_played', 'wins', 'losses')
+    
     def __init__(self, name, true_skill, initial_mu=25.0, initial_sigma=8.333):
         """
         Initialise un joueur
@@ -43,7 +50,7 @@ class Player:
         self.wins = 0
         self.losses = 0
     
-    def play_match(self, beta=25/6):
+    def play_match(self, beta=25/6, rng=None):
         """
         Simule la performance du joueur dans un match
         
@@ -52,11 +59,14 @@ class Player:
         
         Args:
             beta (float): Écart-type de la performance (défaut: 25/6 ≈ 4.17)
+            rng (np.random.Generator): Générateur aléatoire (défaut: générateur du module)
         
         Returns:
             float: Performance du joueur pour ce match
         """
-        return random.gauss(self.true_skill, beta)
+        if rng is None:
+            rng = _default_rng
+        return rng.normal(self.true_skill, beta)
     
     def update_rating(self, new_rating):
         """
@@ -1,26 +1,76 @@
 """
 Simulateur de matchs TrueSkill
 """
-import random
+import numpy as np
 from trueskill import rate_1vs1, quality_1vs1
 
 
+def simulate_batch(true_a, true_b, beta=25/6, rng=None):
+    """
+    Tire en une seule fois les performances d'un lot de matchs 1v1
+    
+    Équivalent vectorisé de Player.play_match : le bruit gaussien des deux
+    côtés de tous les matchs est généré par un seul appel NumPy au lieu de
+    deux tirages séparés par match.
+    
+    Args:
+        true_a (array-like): Vraies compétences des premiers joueurs
+        true_b (array-like): Vraies compétences des seconds joueurs
+        beta (float): Écart-type de la performance (défaut: 25/6 ≈ 4.17)
+        rng (int | np.random.Generator): Seed ou générateur aléatoire (défaut: aléatoire)
+    
+    Returns:
+        tuple: (perf_a, perf_b) sous forme de np.ndarray
+    """
+    rng = np.random.default_rng(rng)
+    true_a = np.asarray(true_a, dtype=float)
+    true_b = np.asarray(true_b, dtype=float)
+    noise_a, noise_b = rng.normal(0.0, beta, (2,) + true_a.shape)
+    return true_a + noise_a, true_b + noise_b
+
+
+def random_pairs(n_players, n_matches, rng=None):
+    """
+    Tire uniformément n_matches paires de joueurs distincts
+    
+    Args:
+        n_players (int): Nombre de joueurs
+        n_matches (int): Nombre de paires à tirer
+        rng (int | np.random.Generator): Seed ou générateur aléatoire (défaut: aléatoire)
+    
+    Returns:
+        tuple: (idx1, idx2), indices des deux joueurs de chaque match
+    """
+    rng = np.random.default_rng(rng)
+    idx1 = rng.integers(n_players, size=n_matches)
+    # Décaler le second indice pour qu'il soit toujours différent du premier
+    idx2 = rng.integers(n_players - 1, size=n_matches)
+    idx2 += idx2 >= idx1
+    return idx1, idx2
+
+
 class MatchSimulator:
     """
     Gère la simulation de matchs entre joueurs
     """
     
-    def __init__(self, players):
+    def __init__(self, players, rng=None, record_history=True):
         """
         Initialise le simulateur
         
         Args:
             players (list[Player]): Liste des joueurs
+            rng (int | np.random.Generator): Seed ou générateur aléatoire
+                utilisé pour les tirages (défaut: aléatoire)
+            record_history (bool): Enregistrer chaque match dans match_history
+                (si False, la qualité du match n'est calculée qu'en mode verbose)
         """
         self.players = players
         self.match_history = []
+        self.record_history = record_history
+        self.rng = np.random.default_rng(rng)
     
-    def simulate_1v1(self, player1, player2, verbose=False):
+    def simulate_1v1(self, player1, player2, verbose=False, perfs=None):
         """
         Simule un match 1v1 entre deux joueurs
         
@@ -31,13 +81,18 @@ class MatchSimulator:
             player1 (Player): Premier joueur
             player2 (Player): Deuxième joueur
             verbose (bool): Afficher les détails du match
+            perfs (tuple): Performances (perf1, perf2) déjà tirées, par exemple
+                avec simulate_batch (défaut: tirées via play_match)
         
         Returns:  
             tuple: (gagnant, perdant)
         """
         # Simuler les performances
-        perf1 = player1.play_match()
-        perf2 = player2.play_match()
+        if perfs is None:
+            perf1 = player1.play_match(rng=self.rng)
+            perf2 = player2.play_match(rng=self.rng)
+        else:
+            perf1, perf2 = perfs
         
         # Déterminer le gagnant
         if perf1 > perf2:
@@ -45,8 +100,10 @@ class MatchSimulator:
         else:
             winner, loser = player2, player1
         
-        # Qualité du match avant (0=déséquilibré, 1=équilibré)
-        match_quality = quality_1vs1(player1.rating, player2.rating)
+        # Qualité du match avant (0=déséquilibré, 1=équilibré),
+        # calculée seulement si elle est enregistrée ou affichée
+        if self.record_history or verbose:
+            match_quality = quality_1vs1(player1.rating, player2.rating)
         
         # Sauvegarder les anciens ratings
         old_rating_winner = winner.rating.mu
@@ -66,15 +123,16 @@ class MatchSimulator:
         loser.record_loss()
         
         # Enregistrer l'historique
-        match_record = {
-            'player1': player1.name,
-            'player2': player2.name,
-            'winner': winner.name,
-            'quality': match_quality,
-            'perf1': perf1,
-            'perf2': perf2
-        }
-        self.match_history.append(match_record)
+        if self.record_history:
+            match_record = {
+                'player1': player1.name,
+                'player2': player2.name,
+                'winner': winner.name,
+                'quality': match_quality,
+                'perf1': perf1,
+                'perf2': perf2
+            }
+            self.match_history.append(match_record)
         
         if verbose:  
             print(f"\n{'='*60}")
@@ -90,6 +148,25 @@ class MatchSimulator:
         
         return winner, loser
     
+    def simulate_pairs(self, idx1, idx2, verbose=False):
+        """
+        Simule un lot de matchs 1v1 entre les joueurs d'indices idx1[k] et idx2[k]
+        
+        Les performances de tous les matchs sont tirées d'un coup avec
+        simulate_batch, puis les ratings sont mis à jour match par match.
+        
+        Args:
+            idx1 (array-like): Indices des premiers joueurs
+            idx2 (array-like): Indices des seconds joueurs
+            verbose (bool): Afficher les détails
+        """
+        pairs = [(self.players[i], self.players[j]) for i, j in zip(idx1, idx2)]
+        perfs1, perfs2 = simulate_batch([p1.true_skill for p1, _ in pairs],
+                                        [p2.true_skill for _, p2 in pairs],
+                                        rng=self.rng)
+        for (player1, player2), perf1, perf2 in zip(pairs, perfs1, perfs2):
+            self.simulate_1v1(player1, player2, verbose=verbose, perfs=(perf1, perf2))
+    
     def simulate_random_matches(self, num_matches, verbose=False):
         """
         Simule un nombre donné de matchs aléatoires
@@ -101,16 +178,16 @@ class MatchSimulator:
         print(f"\n🎮 Simulation de {num_matches} matchs aléatoires...")
         print("="*60)
         
-        for i in range(num_matches):
-            # Choisir 2 joueurs aléatoirement
-            player1, player2 = random.sample(self.players, 2)
-            
-            # Simuler le match
-            self.simulate_1v1(player1, player2, verbose=verbose)
+        # Choisir toutes les paires d'un coup, puis les simuler par lots de 20
+        idx1, idx2 = random_pairs(len(self.players), num_matches, self.rng)
+        
+        for start in range(0, num_matches, 20):
+            end = min(start + 20, num_matches)
+            self.simulate_pairs(idx1[start:end], idx2[start:end], verbose=verbose)
             
             # Afficher un résumé tous les 20 matchs
-            if (i + 1) % 20 == 0 and not verbose:
-                print(f"\n--- Après {i + 1} matchs ---")
+            if end % 20 == 0 and not verbose:
+                print(f"\n--- Après {end} matchs ---")
                 self.print_leaderboard()
     
     def simulate_round_robin(self, rounds=1, verbose=False):
@@ -133,19 +210,15 @@ class MatchSimulator:
                 print(f"\n--- Round {round_num + 1}/{rounds} ---")
             
             # Chaque joueur affronte chaque autre joueur
-            for i in range(len(self.players)):
-                for j in range(i + 1, len(self.players)):
-                    self.simulate_1v1(self.players[i], self.players[j], verbose=verbose)
+            idx1, idx2 = np.triu_indices(n, k=1)
+            self.simulate_pairs(idx1, idx2, verbose=verbose)
         
         print(f"\n✅ Tournoi terminé !")
         self.print_leaderboard()
     
     def print_leaderboard(self):
         """Affiche le classement actuel"""
-        # Trier par rating conservateur (mu - 3*sigma)
-        sorted_players = sorted(self.players, 
-                               key=lambda p:  p.conservative_rating, 
-                               reverse=True)
+        sorted_players = self.get_leaderboard()
         
         print(f"\n{'='*90}")
         print(f"{'Classement':<12} | {'μ (skill)':<15} | {'Conserv.':<10} | {'Vrai': <6} | {'Matchs (W/L)'}")
@@ -163,6 +236,7 @@ class MatchSimulator:
         Returns:
             list[Player]:  Joueurs triés par rating conservateur
         """
+        # Trier par rating conservateur (mu - 3*sigma)
         return sorted(self.players, 
                      key=lambda p: p.conservative_rating, 
                      reverse=True)
@@ -1,11 +1,11 @@
 """
 Fonctions utilitaires
 """
-import random
+import numpy as np
 from src.player import Player
 
 
-def create_random_players(num_players, min_skill=10, max_skill=40):
+def create_random_players(num_players, min_skill=10, max_skill=40, rng=None):
     """
     Crée des joueurs avec des compétences aléatoires
     
@@ -13,10 +13,14 @@ def create_random_players(num_players, min_skill=10, max_skill=40):
         num_players (int): Nombre de joueurs à créer
         min_skill (float): Compétence minimale
         max_skill (float): Compétence maximale
+        rng (int | np.random.Generator): Seed ou générateur aléatoire (défaut: aléatoire)
     
     Returns:
         list[Player]: Liste des joueurs créés
     """
+    rng = np.random.default_rng(rng)
+    true_skills = rng.uniform(min_skill, max_skill, num_players).tolist()
+    
     names = [
         "Alice", "Bob", "Charlie", "David", "Eve", "Frank", 
         "Grace", "Heidi", "Ivan", "Judy", "Kevin", "Laura",
@@ -28,8 +32,7 @@ def create_random_players(num_players, min_skill=10, max_skill=40):
     players = []
     for i in range(num_players):
         name = names[i] if i < len(names) else f"Player{i+1}"
-        true_skill = random.uniform(min_skill, max_skill)
-        players.append(Player(name, true_skill))
+        players.append(Player(name, true_skills[i]))
     
     return players
 
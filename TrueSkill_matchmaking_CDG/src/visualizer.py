@@ -7,7 +7,6 @@ import matplotlib.animation as animation
 import seaborn as sns
 import numpy as np
 from scipy. stats import norm
-from trueskill import quality_1vs1
 
 # Configuration du style
 plt.style.use('seaborn-v0_8-darkgrid')
@@ -50,7 +49,7 @@ def plot_skill_convergence(players, save_path='results/convergence_mu. png'):
     plt.tight_layout()
     plt.savefig(save_path, dpi=300, bbox_inches='tight')
     print(f"Graphique sauvegardé : {save_path}")
-    plt.show()
+    plt.close(fig)
 
 
 def plot_uncertainty_decrease(players, save_path='results/convergence_sigma.png'):
@@ -92,7 +91,7 @@ def plot_uncertainty_decrease(players, save_path='results/convergence_sigma.png'
     plt.tight_layout()
     plt.savefig(save_path, dpi=300, bbox_inches='tight')
     print(f"Graphique sauvegardé : {save_path}")
-    plt.show()
+    plt.close(fig)
 
 
 def plot_before_after(players, save_path='results/before_after.png'):
@@ -165,7 +164,39 @@ def plot_before_after(players, save_path='results/before_after.png'):
     plt.tight_layout()
     plt.savefig(save_path, dpi=300, bbox_inches='tight')
     print(f"Graphique sauvegardé :  {save_path}")
-    plt.show()
+    plt.close(fig)
+
+
+def matchmaking_matrices(players, beta=25/6):
+    """
+    Calcule pour toutes les paires les probabilités de victoire et la qualité
+    
+    Les deux matrices sont obtenues par broadcasting NumPy (différences
+    deux à deux des μ et sommes des σ²) au lieu d'une double boucle Python
+    sur les paires. La qualité reprend la formule fermée de quality_1vs1.
+    
+    Args:
+        players (list[Player]): Liste des joueurs
+        beta (float): Paramètre TrueSkill de performance (défaut: 25/6)
+    
+    Returns:
+        tuple: (win_probs, match_quality), matrices n×n avec la diagonale à NaN
+    """
+    mus = np.array([p.rating.mu for p in players])
+    sigmas2 = np.array([p.rating.sigma for p in players]) ** 2
+    
+    delta_mu = mus[:, None] - mus[None, :]
+    denom = 2 * beta**2 + sigmas2[:, None] + sigmas2[None, :]
+    
+    # Probabilité de victoire (formule TrueSkill) et qualité du match
+    win_probs = norm.cdf(delta_mu / np.sqrt(denom))
+    match_quality = np.sqrt(2 * beta**2 / denom) * np.exp(-delta_mu**2 / (2 * denom))
+    
+    # Diagonale = pas de match contre soi-même
+    np.fill_diagonal(win_probs, np.nan)
+    np.fill_diagonal(match_quality, np.nan)
+    
+    return win_probs, match_quality
 
 
 def plot_matchmaking_heatmap(players, save_path='results/heatmap_matchmaking.png'):
@@ -177,24 +208,9 @@ def plot_matchmaking_heatmap(players, save_path='results/heatmap_matchmaking.png
         save_path (str): Chemin de sauvegarde
     """
     n = len(players)
-    win_probs = np.zeros((n, n))
-    match_quality = np.zeros((n, n))
     
     # Calculer les matrices
-    for i in range(n):
-        for j in range(n):
-            if i == j: 
-                win_probs[i][j] = np.nan  # Diagonale = pas de match contre soi-même
-                match_quality[i][j] = np.nan
-            else:
-                # Probabilité de victoire (formule TrueSkill)
-                delta_mu = players[i].rating.mu - players[j].rating.mu
-                sum_sigma = players[i].rating.sigma**2 + players[j].rating.sigma**2
-                beta = 25/6  # Paramètre TrueSkill standard
-                win_probs[i][j] = norm.cdf(delta_mu / np.sqrt(2 * beta**2 + sum_sigma))
-                
-                # Qualité du match
-                match_quality[i][j] = quality_1vs1(players[i].rating, players[j].rating)
+    win_probs, match_quality = matchmaking_matrices(players)
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 8))
     
@@ -230,7 +246,7 @@ def plot_matchmaking_heatmap(players, save_path='results/heatmap_matchmaking.png
     plt.tight_layout()
     plt.savefig(save_path, dpi=300, bbox_inches='tight')
     print(f"Graphique sauvegardé : {save_path}")
-    plt.show()
+    plt.close(fig)
 
 
 def plot_ranking_comparison(players, save_path='results/ranking_comparison.png'):
@@ -294,7 +310,7 @@ def plot_ranking_comparison(players, save_path='results/ranking_comparison.png')
     plt.tight_layout()
     plt.savefig(save_path, dpi=300, bbox_inches='tight')
     print(f"Graphique sauvegardé : {save_path}")
-    plt.show()
+    plt.close(fig)
 
 
 def plot_confidence_intervals(players, save_path='results/confidence_intervals.png'):
@@ -357,7 +373,7 @@ def plot_confidence_intervals(players, save_path='results/confidence_intervals.p
     plt.tight_layout()
     plt.savefig(save_path, dpi=300, bbox_inches='tight')
     print(f"Graphique sauvegardé : {save_path}")
-    plt.show()
+    plt.close(fig)
 
 
 def plot_all_stats(players, save_path='results/all_stats.png'):
@@ -437,7 +453,7 @@ def plot_all_stats(players, save_path='results/all_stats.png'):
     
     plt.savefig(save_path, dpi=300, bbox_inches='tight')
     print(f"Graphique sauvegardé : {save_path}")
-    plt.show()
+    plt.close(fig)
 
 
 def create_all_visualizations(players):
@@ -527,7 +543,7 @@ def plot_trueskill_vs_elo_convergence(ts_players, elo_players, save_path='result
     plt.tight_layout()
     plt.savefig(save_path, dpi=300, bbox_inches='tight')
     print(f"✅ Graphique sauvegardé : {save_path}")
-    plt.show()
+    plt.close(fig)
 
 
 def plot_comparison_metrics(metrics, save_path='results/comparison_metrics.png'):
@@ -633,4 +649,4 @@ def plot_comparison_metrics(metrics, save_path='results/comparison_metrics.png')
     plt.tight_layout()
     plt.savefig(save_path, dpi=300, bbox_inches='tight')
     print(f"Graphique sauvegardé : {save_path}")
-    plt.show()
\ No newline at end of file
+    plt.close(fig)
\ No newline at end of file